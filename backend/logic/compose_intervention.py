@@ -13,21 +13,101 @@ Flow:
 6. Return structured InterventionResponse
 """
 
-from typing import Dict
+from typing import TypedDict
+from functools import lru_cache
+from itertools import islice
+import hashlib
+import json
 import logging
 import re
-import json
+
+from pydantic import BaseModel, ValidationError
 
 # You.com Agents API client
-from you_client.smart_api import query_agents_api
+from you_client.smart_api import query_agents_api, uses_live_api
+from you_client.base_client import YouAPIError
+
+from you_client.config import config
 
 # Session management
 from logic.session_manager import session_manager
 
+# Repeat-event caching
+from logic.intervention_cache import intervention_cache
+
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns for response parsing
+
+# Sentence boundary: a period followed by whitespace or end of text, except
+# after common abbreviations ("e.g.", "Dr.", "et al.")
+_SENT_SPLIT_RE = re.compile(
+    r'(?<!\b[Ee]\.g)(?<!\b[Ii]\.e)(?<!\b[Vv]s)(?<!\bDr)(?<!\bMr)(?<!\bMs)(?<!\bMrs)(?<!\b[Ee]t al)'
+    r'\.(?:\s+|$)'
+)
+_WORD_RE = re.compile(r'\S+')
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+# Words that mark a sentence as explanation rather than action (substring match)
+_EXPLANATION_RE = re.compile(r'because|this|research|study|shows|activates|reduces', re.IGNORECASE)
+
+# Tokens that don't change what a distraction event means, e.g. in
+# "distraction_www.youtube.com" vs "switched_to_m.youtube.com"
+_KEY_NOISE_TOKENS = frozenset(("distraction", "switched", "to", "www", "m", "com", "org", "net"))
+
+# Action/reasoning pair used when an answer can't be split into sentences
+_GENERIC_SPLIT = (
+    "Close the distraction and take three deep breaths before returning to your task.",
+    "This brief pause resets your attention and reduces the cognitive cost of context switching."
+)
+
+
+# Fixed Agents API instructions, sent ahead of the per-event details so
+# consecutive requests share the same prompt prefix
+_PROMPT_INSTRUCTIONS = """Give me ONE specific, research-backed technique to recover my focus immediately. Base your advice on neuroscience and productivity research. Keep it concise and motivating.
+
+CRITICAL: You MUST respond with ONLY valid JSON in this EXACT format (no other text before or after):
+
+{
+  "action": "One specific immediate action I should take right now - 20-30 words - must be concrete and actionable",
+  "reasoning": "Brief scientific explanation of why this technique is effective - 40-60 words - must be different from the action and explain the underlying mechanism",
+  "source": "Research citation or credible source"
+}
+
+Be direct, practical, and encouraging. The action and reasoning fields must be completely distinct - no repetition."""
+
+# Client-supplied fields are clipped to this many characters in the prompt
+_MAX_PROMPT_FIELD_CHARS = 200
+
+# Per-event part of the prompt
+_PROMPT_TEMPLATE = """I have been working on "{user_goal}" for {time_on_task} minutes in {context_title}, but I got distracted by {distraction_type}.{session_context}
+
+Respond with ONLY the JSON object described above."""
+
+_SESSION_CONTEXT_TEMPLATE = "\n\nNOTE: This is distraction #{distraction_number} in this focus session. Consider the user's pattern and adapt your advice accordingly."
+
+
+class Intervention(TypedDict):
+    """Intervention payload returned to the extension (see InterventionResponse)."""
+    action_now: str
+    why_it_works: str
+    goal_reminder: str
+    citation: str
 
-async def compose_intervention(event) -> Dict[str, str]:
+
+class InterventionParseError(ValueError):
+    """Agents API answer had no usable, distinct action and reasoning."""
+    pass
+
+
+class AgentAnswer(BaseModel):
+    """JSON object the Agents API is prompted to return."""
+    action: str
+    reasoning: str
+    source: str = ""
+
+
+async def compose_intervention(event) -> Intervention:
     """
     Generate a personalized focus intervention using You.com Smart API.
 
@@ -35,7 +115,7 @@ async def compose_intervention(event) -> Dict[str, str]:
         event: FocusEvent with user context, distraction details, and session_id
 
     Returns:
-        Dict with keys: action_now, why_it_works, goal_reminder, citation
+        Intervention dict with keys: action_now, why_it_works, goal_reminder, citation
 
     Implementation:
         Uses You.com Smart API to get evidence-based, citation-backed advice
@@ -51,66 +131,74 @@ async def compose_intervention(event) -> Dict[str, str]:
     
     # Get or create session conversation
     session = session_manager.get_or_create_session(session_id)
-    logger.info(f"Session info: {session.get_summary()}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Session info: %s", session.get_summary())
 
     # Build contextualized prompt for Agents API with JSON response requirement
-    # Include session context if this isn't the first distraction
-    session_context = ""
-    if session.distraction_count > 0:
-        session_context = f"\n\nNOTE: This is distraction #{session.distraction_count + 1} in this focus session. Consider the user's pattern and adapt your advice accordingly."
-    
-    prompt = f"""I have been working on "{user_goal}" for {time_on_task} minutes in {context_title}, but I got distracted by {distraction_type}.{session_context}
-
-Give me ONE specific, research-backed technique to recover my focus immediately. Base your advice on neuroscience and productivity research. Keep it concise and motivating.
-
-CRITICAL: You MUST respond with ONLY valid JSON in this EXACT format (no other text before or after):
-
-{{
-  "action": "One specific immediate action I should take right now - 20-30 words - must be concrete and actionable",
-  "reasoning": "Brief scientific explanation of why this technique is effective - 40-60 words - must be different from the action and explain the underlying mechanism",
-  "source": "Research citation or credible source"
-}}
-
-Be direct, practical, and encouraging. The action and reasoning fields must be completely distinct - no repetition."""
+    prompt = _build_prompt(
+        user_goal, time_on_task, context_title, distraction_type,
+        session.distraction_count + 1
+    )
 
-    logger.info(f"Generating intervention for: {distraction_type} (goal: {user_goal}) - Session distraction #{session.distraction_count + 1}")
+    logger.info(
+        "Generating intervention for: %s (goal: %s) - Session distraction #%d",
+        distraction_type, user_goal, session.distraction_count + 1
+    )
     
     # Get conversation history for context
     conversation_history = session.get_conversation_history(max_messages=6)  # Last 3 exchanges
+
+    # Only a session's first live answer is cacheable; later prompts carry
+    # session history and the advice should adapt to it, and demo/no-key
+    # modes only return templates
+    use_cache = config.CACHE_ENABLED and session.distraction_count == 0 and uses_live_api()
     
     # Add current prompt to session
     session.add_message("user", prompt)
 
     try:
-        # Call You.com Agents API with conversation history
-        response = await query_agents_api(
-            input_text=prompt,
-            agent="express",
-            conversation_history=conversation_history if len(conversation_history) > 0 else None
-        )
-
-        # Parse the Agents API response
-        answer = response.get("answer", "")
-        citations = response.get("citations", [])
-
-        # Extract components from the answer
-        intervention = _parse_agents_api_response(
-            answer=answer,
-            citations=citations,
-            user_goal=user_goal
-        )
+        # Known distraction types can skip the API entirely when configured
+        if not config.LLM_FOR_COMMON_DISTRACTIONS and user_goal and _classify_distraction(distraction_type) != "default":
+            logger.info("Using template intervention for common distraction: %s", distraction_type)
+            intervention = _generate_fallback_intervention(event)
+        # Serve repeat events from cache; otherwise call the Agents API.
+        # Failed calls and unusable answers raise here and are not cached.
+        elif use_cache:
+            key = _cache_key(event)
+            try:
+                intervention = await intervention_cache.get_or_compute(
+                    key,
+                    lambda: _query_intervention(
+                        prompt, conversation_history, user_goal, fallback_to_template=False
+                    )
+                )
+            except YouAPIError:
+                # While the API is failing, an expired answer for this event beats a generic template
+                intervention = intervention_cache.get_stale(key)
+                if intervention is None:
+                    raise
+                logger.warning("Agents API unavailable - serving stale cached intervention")
+            # Cached entries can come from another session; the reminder must show this user's goal
+            intervention["goal_reminder"] = f"Your goal: {user_goal}"
+        # Uncached, but still coalesce duplicate events fired together by one session
+        else:
+            intervention = await intervention_cache.coalesce(
+                (session_id, _cache_key(event)),
+                lambda: _query_intervention(prompt, conversation_history, user_goal)
+            )
         
         # Add assistant's response to session history
         assistant_summary = f"ACTION: {intervention['action_now']}\nREASONING: {intervention['why_it_works']}"
         session.add_message("assistant", assistant_summary)
 
         logger.info("Intervention generated successfully")
-        logger.info(f"Updated session: {session.get_summary()}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Updated session: %s", session.get_summary())
         
         return intervention
 
     except Exception as e:
-        logger.error(f"Error generating intervention: {e}")
+        logger.error("Error generating intervention: %s", e)
         # Fallback to template-based intervention
         fallback = _generate_fallback_intervention(event)
         
@@ -121,20 +209,107 @@ Be direct, practical, and encouraging. The action and reasoning fields must be c
         return fallback
 
 
+@lru_cache(maxsize=512)
+def _build_prompt(
+    user_goal: str,
+    time_on_task: int,
+    context_title: str,
+    distraction_type: str,
+    distraction_number: int
+) -> str:
+    """Fill the Agents API prompt; repeat events reuse the same string."""
+    # Include session context if this isn't the first distraction
+    session_context = ""
+    if distraction_number > 1:
+        session_context = _SESSION_CONTEXT_TEMPLATE.format(distraction_number=distraction_number)
+
+    return _PROMPT_TEMPLATE.format_map({
+        "user_goal": _clip_field(user_goal),
+        "time_on_task": time_on_task,
+        "context_title": _clip_field(context_title),
+        "distraction_type": _clip_field(distraction_type),
+        "session_context": session_context
+    })
+
+
+def _clip_field(text: str) -> str:
+    """Clip a client-supplied field so an oversized value can't inflate the prompt."""
+    if len(text) <= _MAX_PROMPT_FIELD_CHARS:
+        return text
+    return text[:_MAX_PROMPT_FIELD_CHARS].rstrip() + "..."
+
+
+def _normalize_key_text(text: str) -> str:
+    """Collapse case and whitespace so trivially different free text shares a cache key."""
+    return " ".join(text.lower().split())
+
+
+def _normalize_key_event(text: str) -> str:
+    """Reduce a distraction event to its sorted, de-duplicated word tokens minus prefix/domain noise."""
+    return " ".join(sorted(set(_TOKEN_RE.findall(text.lower())) - _KEY_NOISE_TOKENS))
+
+
+def _cache_key(event) -> bytes:
+    """Build the cache key for an event: SHA-256 of goal, distraction, context and 5-minute time bucket."""
+    payload = json.dumps({
+        "goal": _normalize_key_text(event.goal),
+        "distraction": _normalize_key_event(event.event),
+        "context": _normalize_key_text(event.context_title),
+        "time_bucket": round(event.time_on_task_minutes / 5)
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode()).digest()
+
+
+async def _query_intervention(
+    prompt: str,
+    conversation_history: list,
+    user_goal: str,
+    fallback_to_template: bool = True
+) -> Intervention:
+    """
+    Call the You.com Agents API and parse its answer into an intervention.
+
+    With fallback_to_template=False, a failed call or an unusable answer
+    raises instead of returning generic content, so it is never cached.
+    """
+    response = await query_agents_api(
+        input_text=prompt,
+        instructions=_PROMPT_INSTRUCTIONS,
+        agent="express",
+        conversation_history=conversation_history if len(conversation_history) > 0 else None,
+        fallback_to_template=fallback_to_template
+    )
+
+    # Parse the Agents API response
+    answer = response.get("answer", "")
+    citations = response.get("citations", [])
+
+    # Extract components from the answer
+    return _parse_agents_api_response(
+        answer=answer,
+        citations=citations,
+        user_goal=user_goal,
+        strict=not fallback_to_template
+    )
+
+
 def _parse_agents_api_response(
     answer: str,
     citations: list,
-    user_goal: str
-) -> Dict[str, str]:
+    user_goal: str,
+    strict: bool = False
+) -> Intervention:
     """
     Parse Agents API JSON response into intervention components with robust validation.
 
-    The Agents API should return a JSON object with:
+    The Agents API should return a JSON object matching AgentAnswer:
     - action: The immediate action to take
     - reasoning: The scientific explanation
     - source: Citation or source attribution
 
     This function ensures action and reasoning are always distinct.
+    With strict=True it raises InterventionParseError instead of falling
+    back to generic or default text.
     """
     action_now = ""
     why_it_works = ""
@@ -144,68 +319,79 @@ def _parse_agents_api_response(
         # Parse JSON response - try to find JSON object in the answer
         json_str = answer.strip()
         
-        # If there's markdown code blocks, extract JSON from within
-        if "```json" in json_str:
-            json_match = re.search(r'```json\s*\n(.*?)\n```', json_str, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(1).strip()
-        elif "```" in json_str:
-            json_match = re.search(r'```\s*\n(.*?)\n```', json_str, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(1).strip()
+        # If there's a markdown code block, extract JSON from within
+        if not json_str.startswith('{') and "```" in json_str:
+            _, _, fenced = json_str.partition("```")
+            if fenced.startswith("json"):
+                fenced = fenced[4:]
+            json_str = fenced.partition("```")[0].strip()
         
         # Find JSON object if there's extra text
         if not json_str.startswith('{'):
-            json_match = re.search(r'\{.*?"action".*?\}', json_str, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(0)
+            start = json_str.find('{')
+            end = json_str.rfind('}')
+            if start != -1 and end > start:
+                json_str = json_str[start:end + 1]
         
-        # Parse the JSON
-        data = json.loads(json_str)
+        # Parse and validate the JSON against the expected schema
+        data = AgentAnswer.model_validate_json(json_str)
         
-        # Extract fields directly from JSON
-        action_now = data.get("action", "").strip()
-        why_it_works = data.get("reasoning", "").strip()
-        citation = data.get("source", "").strip()
+        action_now = data.action.strip()
+        why_it_works = data.reasoning.strip()
+        citation = data.source.strip()
         
         logger.info("Successfully parsed JSON response")
         
-    except (json.JSONDecodeError, AttributeError, ValueError) as e:
-        logger.warning(f"Failed to parse JSON response: {e}. Using fallback.")
+    except (ValidationError, AttributeError, ValueError) as e:
+        logger.warning("Failed to parse JSON response: %s. Using fallback.", e)
 
     # Extract citation from citations list if not found in JSON
     if not citation and citations:
-        citation = citations[0] if isinstance(citations[0], str) else str(citations[0])
+        first = citations[0]
+        citation = first if type(first) is str else str(first)
 
     if not citation:
         citation = "You.com AI Research"
 
-    # CRITICAL VALIDATION: Ensure action_now and why_it_works are different
-    if action_now and why_it_works:
-        if _are_texts_too_similar(action_now, why_it_works):
-            logger.warning("Detected duplicate content in action and reasoning - applying fix")
-            combined = action_now if len(action_now) > len(why_it_works) else why_it_works
-            action_now, why_it_works = _split_into_action_and_reasoning(combined)
-
-    # Apply length constraints
-    action_now = _truncate_text(action_now, max_words=40)
-    why_it_works = _truncate_text(why_it_works, max_words=80)
-
-    # Final fallback if validation fails
-    if not action_now or not why_it_works or _are_texts_too_similar(action_now, why_it_works):
-        logger.error("Failed to parse distinct action and reasoning - using safe defaults")
+    # Happy path: the JSON already holds a distinct action and reasoning
+    if action_now and why_it_works and not _are_texts_too_similar(action_now, why_it_works):
         return {
-            "action_now": "Take a 90-second walk away from your screen, then return to your task.",
-            "why_it_works": "Brief physical movement resets prefrontal cortex activity and reduces the cognitive switching cost from distractions. Stanford research shows this restores focus faster than staying seated.",
+            "action_now": _truncate_text(action_now, max_words=40),
+            "why_it_works": _truncate_text(why_it_works, max_words=80),
             "goal_reminder": f"Your goal: {user_goal}",
-            "citation": "Stanford Neuroscience Research (2024)"
+            "citation": citation
         }
 
+    # CRITICAL VALIDATION: Ensure action_now and why_it_works are different
+    if action_now and why_it_works:
+        logger.warning("Detected duplicate content in action and reasoning - applying fix")
+        combined = action_now if len(action_now) > len(why_it_works) else why_it_works
+        split = _split_into_action_and_reasoning(combined)
+        if strict and split == _GENERIC_SPLIT:
+            raise InterventionParseError("Agents API answer could not be split into action and reasoning")
+        action_now, why_it_works = split
+
+        # Apply length constraints
+        action_now = _truncate_text(action_now, max_words=40)
+        why_it_works = _truncate_text(why_it_works, max_words=80)
+
+        if not _are_texts_too_similar(action_now, why_it_works):
+            return {
+                "action_now": action_now,
+                "why_it_works": why_it_works,
+                "goal_reminder": f"Your goal: {user_goal}",
+                "citation": citation
+            }
+
+    # Final fallback if validation fails
+    if strict:
+        raise InterventionParseError("Agents API answer has no distinct action and reasoning")
+    logger.error("Failed to parse distinct action and reasoning - using safe defaults")
     return {
-        "action_now": action_now or "Take a 90-second walk, then return to work.",
-        "why_it_works": why_it_works or "Brief breaks reset attention and restore focus.",
+        "action_now": "Take a 90-second walk away from your screen, then return to your task.",
+        "why_it_works": "Brief physical movement resets prefrontal cortex activity and reduces the cognitive switching cost from distractions. Stanford research shows this restores focus faster than staying seated.",
         "goal_reminder": f"Your goal: {user_goal}",
-        "citation": citation or "Focus recovery research"
+        "citation": "Stanford Neuroscience Research (2024)"
     }
 
 
@@ -214,29 +400,34 @@ def _are_texts_too_similar(text1: str, text2: str) -> bool:
     if not text1 or not text2:
         return False
 
-    # Normalize for comparison
-    t1 = text1.lower().strip()
-    t2 = text2.lower().strip()
+    if text1 == text2:
+        return True
+
+    # Normalize for comparison (split() also drops leading/trailing whitespace)
+    t1 = ' '.join(text1.lower().split())
+    t2 = ' '.join(text2.lower().split())
 
     # Check if identical
     if t1 == t2:
         return True
 
-    # Check if one contains the other (with some tolerance)
+    # Check if one contains the other (whole-text containment). Partial
+    # overlap is not enough: a reasoning that quotes parts of the action
+    # while explaining it is distinct advice, not a duplicate
     if len(t1) > 20 and len(t2) > 20:
         if t1 in t2 or t2 in t1:
             return True
 
-    # Check if they start with the same content (likely copy-paste)
+    # Check if they start with the same 50 characters
     min_len = min(len(t1), len(t2))
     if min_len > 50:
-        # If first 50 chars are identical, they're too similar
         if t1[:50] == t2[:50]:
             return True
 
     return False
 
 
+@lru_cache(maxsize=256)
 def _split_into_action_and_reasoning(text: str) -> tuple:
     """
     Intelligently split combined text into action and reasoning.
@@ -244,50 +435,62 @@ def _split_into_action_and_reasoning(text: str) -> tuple:
     Returns:
         tuple: (action_now, why_it_works)
     """
-    # Try to find a natural split point
-    sentences = re.split(r'\.(?:\s+|$)', text)
-    sentences = [s.strip() + '.' for s in sentences if s.strip()]
-
-    if len(sentences) >= 2:
+    # Find sentence spans in the original text; each end includes its period
+    spans = []
+    start = 0
+    for match in _SENT_SPLIT_RE.finditer(text):
+        if _WORD_RE.search(text, start, match.start()):
+            spans.append((start, match.start() + 1))
+        start = match.end()
+    if _WORD_RE.search(text, start):
+        spans.append((start, len(text)))
+
+    if len(spans) >= 2:
         # First sentence(s) as action, rest as reasoning
         # Look for keywords that indicate explanation
-        explanation_start = -1
-        for i, sent in enumerate(sentences):
-            if any(keyword in sent.lower() for keyword in ['because', 'this', 'research', 'study', 'shows', 'activates', 'reduces']):
-                explanation_start = i
-                break
+        explanation_start = next(
+            (i for i, (s, e) in enumerate(spans) if _EXPLANATION_RE.search(text, s, e)),
+            -1
+        )
 
         if explanation_start > 0:
-            action = ' '.join(sentences[:explanation_start])
-            reasoning = ' '.join(sentences[explanation_start:])
+            split = explanation_start
         else:
             # Default: split roughly in half
-            mid = len(sentences) // 2
-            if mid == 0:
-                mid = 1
-            action = ' '.join(sentences[:mid])
-            reasoning = ' '.join(sentences[mid:])
+            split = max(len(spans) // 2, 1)
+
+        action = text[spans[0][0]:spans[split - 1][1]].strip()
+        reasoning = text[spans[split][0]:spans[-1][1]].strip()
+        if not reasoning.endswith('.'):
+            reasoning += '.'
 
         return (action, reasoning)
 
     # If only one sentence, create a generic split
-    return (
-        "Close the distraction and take three deep breaths before returning to your task.",
-        "This brief pause resets your attention and reduces the cognitive cost of context switching."
-    )
+    return _GENERIC_SPLIT
 
 
+@lru_cache(maxsize=1024)
 def _truncate_text(text: str, max_words: int) -> str:
     """Truncate text to maximum number of words while preserving sentence structure."""
     if not text:
         return text
 
-    words = text.split()
-    if len(words) <= max_words:
+    # Every word takes at least one character plus a separator, so text this
+    # short can never exceed the limit
+    if len(text) <= 2 * max_words:
+        return text
+
+    # Find the end of the max_words-th word without building a word list
+    words = _WORD_RE.finditer(text)
+    last_word = None
+    for last_word in islice(words, max_words):
+        pass
+    if last_word is None or next(words, None) is None:
         return text
 
     # Truncate and try to end at sentence boundary
-    truncated = ' '.join(words[:max_words])
+    truncated = text[:last_word.end()]
 
     # If we're in the middle of a sentence, try to complete it
     if not truncated.endswith('.'):
@@ -302,48 +505,65 @@ def _truncate_text(text: str, max_words: int) -> str:
     return truncated
 
 
-def _generate_fallback_intervention(event) -> Dict[str, str]:
+# Keyword -> fallback category, checked in order against the lowercased event
+_DISTRACTION_KEYWORDS = (
+    ("youtube", "video"),
+    ("video", "video"),
+    ("social", "social"),
+    ("twitter", "social"),
+    ("facebook", "social"),
+)
+
+# Fallback category -> (action, why_it_works template, citation)
+_FALLBACK_TEMPLATES = {
+    "video": (
+        "Stand up and take a 90-second walk around your space—no phone.",
+        "Stanford research shows brief walks reset the prefrontal cortex "
+        "and reduce the 'switching cost' from entertainment to deep work. "
+        "You've already invested {time_on_task} minutes—don't lose momentum.",
+        "Oppezzo & Schwartz, Stanford (2023)"
+    ),
+    "social": (
+        "Close all tabs except your work. Set a 25-minute timer. Start.",
+        "Social media triggers dopamine spikes that make returning to cognitively "
+        "demanding work harder. A clean slate + time constraint reactivates focus. "
+        "Your goal ('{user_goal}') is waiting.",
+        "Newport, 'Deep Work' + Meta internal study (2024)"
+    ),
+    "default": (
+        "Take 3 deep breaths. Write one sentence about what you'll do next.",
+        "Box breathing activates the parasympathetic nervous system, reducing "
+        "cortisol and restoring executive function. Writing clarifies intent. "
+        "You were {time_on_task} minutes in—you can get back.",
+        "Harvard Medical School (2024)"
+    ),
+}
+
+
+def _classify_distraction(distraction_type: str) -> str:
+    """Map a distraction event to a fallback template category."""
+    distraction_type = distraction_type.lower()
+    return next(
+        (category for keyword, category in _DISTRACTION_KEYWORDS if keyword in distraction_type),
+        "default"
+    )
+
+
+def _generate_fallback_intervention(event) -> Intervention:
     """
     Fallback intervention using templates when API is unavailable.
 
     This ensures the system always returns a valid intervention.
     """
     user_goal = event.goal
-    time_on_task = event.time_on_task_minutes
-    distraction_type = event.event.lower()
-
-    # Customize based on distraction type
-    if "youtube" in distraction_type or "video" in distraction_type:
-        action = "Stand up and take a 90-second walk around your space—no phone."
-        why = (
-            "Stanford research shows brief walks reset the prefrontal cortex "
-            "and reduce the 'switching cost' from entertainment to deep work. "
-            f"You've already invested {time_on_task} minutes—don't lose momentum."
-        )
-        citation = "Oppezzo & Schwartz, Stanford (2023)"
-
-    elif "social" in distraction_type or "twitter" in distraction_type or "facebook" in distraction_type:
-        action = "Close all tabs except your work. Set a 25-minute timer. Start."
-        why = (
-            "Social media triggers dopamine spikes that make returning to cognitively "
-            "demanding work harder. A clean slate + time constraint reactivates focus. "
-            f"Your goal ('{user_goal}') is waiting."
-        )
-        citation = "Newport, 'Deep Work' + Meta internal study (2024)"
-
-    else:
-        # Default intervention
-        action = "Take 3 deep breaths. Write one sentence about what you'll do next."
-        why = (
-            "Box breathing activates the parasympathetic nervous system, reducing "
-            "cortisol and restoring executive function. Writing clarifies intent. "
-            f"You were {time_on_task} minutes in—you can get back."
-        )
-        citation = "Harvard Medical School (2024)"
+    action, why_template, citation = _FALLBACK_TEMPLATES[_classify_distraction(event.event)]
 
     return {
         "action_now": action,
-        "why_it_works": why,
+        "why_it_works": why_template.format(
+            time_on_task=event.time_on_task_minutes,
+            user_goal=user_goal
+        ),
         "goal_reminder": f"Your goal: {user_goal}",
         "citation": citation
     }
@@ -0,0 +1,217 @@
+"""
+Intervention Cache
+
+In-process TTL + LRU cache for generated interventions, so repeat
+distraction events can be answered without another You.com API call.
+Concurrent requests for the same key share a single in-flight call,
+which keeps running even if one of its callers goes away.
+
+Expired entries are kept for a while as a stale tier that can be served
+when the API is failing. Entries can optionally be written through to a
+SQLite file so a warm cache survives process restarts. Persistence is
+best-effort: SQLite errors are logged and the in-memory cache carries on.
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from you_client.config import config
+
+logger = logging.getLogger(__name__)
+
+# How long a SQLite call may wait on another process's lock; it runs on the
+# event loop, so a busy cache file is skipped rather than waited out
+_DB_TIMEOUT_SECONDS = 0.05
+
+
+class InterventionCache:
+    """LRU cache of intervention dicts with per-entry expiry."""
+
+    def __init__(
+        self,
+        maxsize: int = 512,
+        ttl_seconds: int = 600,
+        db_path: str = "",
+        stale_seconds: int = 86400
+    ):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.entries: "OrderedDict[Hashable, Tuple[float, Dict[str, str]]]" = OrderedDict()
+        self.inflight: Dict[Hashable, asyncio.Task] = {}
+
+        self.db: Optional[sqlite3.Connection] = None
+        if db_path:
+            try:
+                self.db = sqlite3.connect(
+                    db_path,
+                    timeout=_DB_TIMEOUT_SECONDS,
+                    isolation_level=None,
+                    check_same_thread=False
+                )
+                # WAL lets readers in other workers proceed while one writes
+                self.db.execute("PRAGMA journal_mode=WAL")
+                self.db.execute("PRAGMA synchronous=NORMAL")
+                self.db.execute(
+                    "CREATE TABLE IF NOT EXISTS interventions "
+                    "(key BLOB PRIMARY KEY, intervention TEXT NOT NULL, expires_at REAL NOT NULL)"
+                )
+                self.db.execute(
+                    "DELETE FROM interventions WHERE expires_at <= ?",
+                    (time.time() - stale_seconds,)
+                )
+            except sqlite3.Error as e:
+                logger.warning("Intervention cache file unavailable, caching in memory only: %s", e)
+                self.db = None
+
+    def get(self, key: Hashable) -> Optional[Dict[str, str]]:
+        """Get a cached intervention, or None if missing or expired."""
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = self._load(key)
+            if entry is None:
+                return None
+
+        expires_at, intervention = entry
+        now = time.monotonic()
+        if now >= expires_at:
+            # Keep expired entries around as stale fallbacks until they age out
+            if now >= expires_at + self.stale_seconds:
+                del self.entries[key]
+            return None
+
+        self.entries.move_to_end(key)
+        return dict(intervention)
+
+    def get_stale(self, key: Hashable) -> Optional[Dict[str, str]]:
+        """Get an intervention even if expired, or None if missing or too old."""
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = self._load(key)
+            if entry is None:
+                return None
+
+        expires_at, intervention = entry
+        if time.monotonic() >= expires_at + self.stale_seconds:
+            del self.entries[key]
+            return None
+
+        return dict(intervention)
+
+    def set(self, key: Hashable, intervention: Dict[str, str]):
+        """Store an intervention, evicting the least recently used entries."""
+        self._remember(key, (time.monotonic() + self.ttl_seconds, dict(intervention)))
+
+        if self.db is not None:
+            try:
+                self.db.execute(
+                    "INSERT OR REPLACE INTO interventions VALUES (?, ?, ?)",
+                    (key, json.dumps(intervention), time.time() + self.ttl_seconds)
+                )
+            except sqlite3.Error as e:
+                logger.warning("Failed to persist cached intervention: %s", e)
+
+    def _remember(self, key: Hashable, entry: Tuple[float, Dict[str, str]]):
+        """Put an entry in memory as most recently used, evicting the least recently used."""
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def _load(self, key: Hashable) -> Optional[Tuple[float, Dict[str, str]]]:
+        """Load an entry still within its stale window from the SQLite store into memory."""
+        if self.db is None:
+            return None
+
+        try:
+            row = self.db.execute(
+                "SELECT intervention, expires_at FROM interventions WHERE key = ? AND expires_at > ?",
+                (key, time.time() - self.stale_seconds)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("Failed to read cached intervention: %s", e)
+            return None
+        if row is None:
+            return None
+
+        # Stored expiry is wall-clock; convert it to the monotonic clock used in memory
+        entry = (time.monotonic() + row[1] - time.time(), json.loads(row[0]))
+        self._remember(key, entry)
+        return entry
+
+    async def get_or_compute(
+        self,
+        key: Hashable,
+        compute: Callable[[], Awaitable[Dict[str, str]]]
+    ) -> Dict[str, str]:
+        """
+        Return the cached intervention for key, computing it on a miss.
+
+        If another request is already computing the same key, await that
+        call instead of starting a duplicate one.
+        """
+        cached = self.get(key)
+        if cached is not None:
+            logger.info("Intervention cache hit")
+            return cached
+
+        return await self.coalesce(key, lambda: self._compute_and_store(key, compute))
+
+    async def coalesce(
+        self,
+        key: Hashable,
+        compute: Callable[[], Awaitable[Dict[str, str]]]
+    ) -> Dict[str, str]:
+        """Run compute() once for all concurrent callers with the same key."""
+        task = self.inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(compute())
+            self.inflight[key] = task
+            task.add_done_callback(lambda done: self._finish_inflight(key, done))
+        else:
+            logger.info("Joining in-flight intervention request")
+
+        # Shield the shared call so one caller disconnecting doesn't cancel it for the rest
+        return dict(await asyncio.shield(task))
+
+    def _finish_inflight(self, key: Hashable, task: asyncio.Task):
+        """Forget a finished in-flight call."""
+        self.inflight.pop(key, None)
+
+        # Mark the exception as retrieved; callers that are still waiting
+        # receive it, and abandoned calls shouldn't log a warning
+        if not task.cancelled():
+            task.exception()
+
+    async def _compute_and_store(
+        self,
+        key: Hashable,
+        compute: Callable[[], Awaitable[Dict[str, str]]]
+    ) -> Dict[str, str]:
+        """Run compute() and cache its result."""
+        intervention = await compute()
+        self.set(key, intervention)
+        return intervention
+
+    def clear(self):
+        """Drop all cached interventions."""
+        self.entries.clear()
+        if self.db is not None:
+            try:
+                self.db.execute("DELETE FROM interventions")
+            except sqlite3.Error as e:
+                logger.warning("Failed to clear intervention cache file: %s", e)
+
+
+# Global intervention cache instance
+intervention_cache = InterventionCache(
+    maxsize=512,
+    ttl_seconds=config.CACHE_TTL,
+    db_path=config.CACHE_DB_PATH
+)
@@ -7,40 +7,55 @@ the user's session history.
 """
 
 import logging
-from typing import Dict, List, Optional
+import time
+from collections import OrderedDict, deque
+from itertools import islice
+from typing import Deque, Dict, List, Optional
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
+# Messages kept per session; older ones are dropped as new ones arrive
+MAX_SESSION_MESSAGES = 200
+
 
 class ConversationMessage:
     """Represents a single message in the conversation."""
+
+    __slots__ = ("role", "content", "timestamp")
     
     def __init__(self, role: str, content: str):
         self.role = role  # "user" or "assistant"
         self.content = content
-        self.timestamp = datetime.now()
+        self.timestamp = time.time()
 
 
 class SessionConversation:
     """Manages conversation history for a single focus session."""
+
+    __slots__ = ("session_id", "messages", "created_at", "last_active", "distraction_count")
     
     def __init__(self, session_id: str):
         self.session_id = session_id
-        self.messages: List[ConversationMessage] = []
+        self.messages: Deque[ConversationMessage] = deque(maxlen=MAX_SESSION_MESSAGES)
         self.created_at = datetime.now()
-        self.last_activity = datetime.now()
+        self.last_active = time.monotonic()  # For timeouts; see last_activity for display
         self.distraction_count = 0
         
     def add_message(self, role: str, content: str):
         """Add a message to the conversation history."""
         message = ConversationMessage(role, content)
         self.messages.append(message)
-        self.last_activity = datetime.now()
+        self.last_active = time.monotonic()
         
         if role == "user":
             self.distraction_count += 1
             
+    @property
+    def last_activity(self) -> datetime:
+        """Wall-clock time of the last message, for reporting."""
+        return datetime.now() - timedelta(seconds=time.monotonic() - self.last_active)
+
     def get_conversation_history(self, max_messages: int = 10) -> List[Dict[str, str]]:
         """
         Get recent conversation history for context.
@@ -48,10 +63,10 @@ class SessionConversation:
         Returns:
             List of message dicts with 'role' and 'content'
         """
-        recent_messages = self.messages[-max_messages:]
+        start = max(len(self.messages) - max_messages, 0)
         return [
             {"role": msg.role, "content": msg.content}
-            for msg in recent_messages
+            for msg in islice(self.messages, start, None)
         ]
     
     def get_summary(self) -> str:
@@ -68,32 +83,34 @@ class SessionManager:
     """Global manager for all active sessions."""
     
     def __init__(self):
-        self.sessions: Dict[str, SessionConversation] = {}
+        # Kept in last-access order, so expired sessions collect at the front
+        self.sessions: "OrderedDict[str, SessionConversation]" = OrderedDict()
         self.session_timeout_minutes = 60  # Clean up inactive sessions after 1 hour
         
     def get_or_create_session(self, session_id: str) -> SessionConversation:
         """Get existing session or create new one."""
-        if session_id not in self.sessions:
-            logger.info(f"Creating new conversation session: {session_id}")
-            self.sessions[session_id] = SessionConversation(session_id)
+        session = self.sessions.get(session_id)
+        if session is None:
+            logger.info("Creating new conversation session: %s", session_id)
+            session = self.sessions[session_id] = SessionConversation(session_id)
         else:
-            logger.info(f"Using existing conversation session: {session_id}")
+            logger.info("Using existing conversation session: %s", session_id)
+            self.sessions.move_to_end(session_id)
             
-        return self.sessions[session_id]
+        return session
     
     def cleanup_old_sessions(self):
         """Remove sessions that have been inactive for too long."""
-        now = datetime.now()
-        timeout = timedelta(minutes=self.session_timeout_minutes)
-        
-        expired_sessions = [
-            sid for sid, session in self.sessions.items()
-            if now - session.last_activity > timeout
-        ]
+        cutoff = time.monotonic() - self.session_timeout_minutes * 60
         
-        for sid in expired_sessions:
-            logger.info(f"Cleaning up expired session: {sid}")
-            del self.sessions[sid]
+        # Stop at the first session that is still active; everything behind
+        # it was accessed more recently
+        while self.sessions:
+            sid, session = next(iter(self.sessions.items()))
+            if session.last_active >= cutoff:
+                break
+            logger.info("Cleaning up expired session: %s", sid)
+            self.sessions.popitem(last=False)
             
     def get_session_info(self) -> Dict:
         """Get info about all active sessions."""
@@ -6,17 +6,34 @@ calls You.com APIs to generate evidence-based interventions,
 and returns structured guidance to help users recover focus.
 """
 
+import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 from logic.compose_intervention import compose_intervention
 from logic.session_manager import session_manager
 from you_client.config import config as you_config
+from you_client.base_client import close_shared_client
+
+# Configure logging once for the whole app
+logging.basicConfig(level=logging.DEBUG if you_config.DEBUG else logging.INFO)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Release the shared You.com HTTP connection pool on shutdown."""
+    yield
+    await close_shared_client()
+
 
 app = FastAPI(
     title="FocusAura API",
     description="AI focus assistant backend powered by You.com intelligence",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS configuration for Chrome extension development
@@ -0,0 +1,47 @@
+import unittest
+
+from logic.compose_intervention import _are_texts_too_similar, _split_into_action_and_reasoning
+
+
+class AreTextsTooSimilarTest(unittest.TestCase):
+    ACTION = (
+        "Close YouTube, put your phone in a drawer, and set a 25-minute timer "
+        "to write the next section of your project proposal."
+    )
+
+    def test_reasoning_that_restates_and_explains_action_is_distinct(self):
+        reasoning = (
+            "Closing YouTube and putting your phone in a drawer removes the cues "
+            "that pull your attention away, and a 25-minute timer to write the "
+            "next section of your proposal gives your brain a short, bounded goal "
+            "that lowers the effort of getting started again."
+        )
+        self.assertFalse(_are_texts_too_similar(self.ACTION, reasoning))
+
+    def test_whitespace_and_case_differences_are_duplicates(self):
+        repeated = "  close youtube,  put your phone in a drawer, and set a 25-minute\ntimer to write the next section of your project proposal. "
+        self.assertTrue(_are_texts_too_similar(self.ACTION, repeated))
+
+    def test_reasoning_containing_whole_action_is_duplicate(self):
+        self.assertTrue(_are_texts_too_similar(self.ACTION, self.ACTION + " Do it now."))
+
+
+class SplitIntoActionAndReasoningTest(unittest.TestCase):
+    def test_lowercase_unit_ends_sentence(self):
+        action, reasoning = _split_into_action_and_reasoning(
+            "Stand up and stretch. Movement resets attention within 500 ms. "
+            "This works because blood flow to the brain rises."
+        )
+        self.assertEqual(action, "Stand up and stretch. Movement resets attention within 500 ms.")
+        self.assertEqual(reasoning, "This works because blood flow to the brain rises.")
+
+    def test_abbreviations_do_not_end_sentence(self):
+        action, reasoning = _split_into_action_and_reasoning(
+            "Ask Dr. Lee for help, e.g. by email. This works because it commits you."
+        )
+        self.assertEqual(action, "Ask Dr. Lee for help, e.g. by email.")
+        self.assertEqual(reasoning, "This works because it commits you.")
+
+
+if __name__ == "__main__":
+    unittest.main()
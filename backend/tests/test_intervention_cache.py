@@ -0,0 +1,130 @@
+import os
+import sqlite3
+import tempfile
+import time
+import unittest
+
+from logic.intervention_cache import InterventionCache
+
+INTERVENTION = {
+    "action_now": "Close the tab and open your draft.",
+    "why_it_works": "Removing the cue lowers the pull of novelty.",
+    "goal_reminder": "Your goal: Write report",
+    "citation": "You.com AI Research"
+}
+
+
+class InterventionCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmpdir.name, "cache.db")
+        self.caches = []
+
+    def tearDown(self):
+        for cache in self.caches:
+            if cache.db is not None:
+                cache.db.close()
+        self.tmpdir.cleanup()
+
+    def make_cache(self, **kwargs) -> InterventionCache:
+        kwargs.setdefault("db_path", self.db_path)
+        cache = InterventionCache(**kwargs)
+        self.caches.append(cache)
+        return cache
+
+
+class PersistenceTest(InterventionCacheTestCase):
+    def test_entry_survives_restart(self):
+        self.make_cache().set(b"k", INTERVENTION)
+        self.assertEqual(self.make_cache().get(b"k"), INTERVENTION)
+
+    def test_expired_entry_is_stale_after_restart(self):
+        self.make_cache(ttl_seconds=0).set(b"k", INTERVENTION)
+        time.sleep(0.01)
+
+        cache = self.make_cache(ttl_seconds=0)
+        self.assertIsNone(cache.get(b"k"))
+        self.assertEqual(cache.get_stale(b"k"), INTERVENTION)
+
+    def test_entry_past_stale_window_is_pruned(self):
+        self.make_cache(ttl_seconds=0).set(b"k", INTERVENTION)
+        time.sleep(0.01)
+
+        cache = self.make_cache(ttl_seconds=0, stale_seconds=0)
+        self.assertIsNone(cache.get_stale(b"k"))
+        count = cache.db.execute("SELECT COUNT(*) FROM interventions").fetchone()[0]
+        self.assertEqual(count, 0)
+
+    def test_loaded_entries_respect_maxsize(self):
+        writer = self.make_cache()
+        for i in range(5):
+            writer.set(bytes([i]), INTERVENTION)
+
+        cache = self.make_cache(maxsize=2)
+        for i in range(5):
+            self.assertEqual(cache.get(bytes([i])), INTERVENTION)
+        self.assertEqual(list(cache.entries), [bytes([3]), bytes([4])])
+
+
+class BestEffortPersistenceTest(InterventionCacheTestCase):
+    def test_set_keeps_memory_entry_when_file_is_locked(self):
+        cache = self.make_cache()
+        locker = sqlite3.connect(self.db_path, isolation_level=None)
+        locker.execute("BEGIN EXCLUSIVE")
+        try:
+            started = time.monotonic()
+            with self.assertLogs("logic.intervention_cache", "WARNING"):
+                cache.set(b"k", INTERVENTION)
+            self.assertLess(time.monotonic() - started, 1.0)
+        finally:
+            locker.execute("ROLLBACK")
+            locker.close()
+
+        self.assertEqual(cache.get(b"k"), INTERVENTION)
+
+    def test_get_misses_when_file_is_unreadable(self):
+        cache = self.make_cache()
+        cache.db.close()
+        with self.assertLogs("logic.intervention_cache", "WARNING"):
+            self.assertIsNone(cache.get(b"k"))
+            self.assertIsNone(cache.get_stale(b"k"))
+
+    def test_unopenable_file_falls_back_to_memory(self):
+        with self.assertLogs("logic.intervention_cache", "WARNING"):
+            cache = self.make_cache(db_path=self.tmpdir.name)
+        self.assertIsNone(cache.db)
+        cache.set(b"k", INTERVENTION)
+        self.assertEqual(cache.get(b"k"), INTERVENTION)
+
+
+class GetOrComputeTest(InterventionCacheTestCase, unittest.IsolatedAsyncioTestCase):
+    async def test_computed_answer_is_returned_when_file_is_locked(self):
+        cache = self.make_cache()
+        locker = sqlite3.connect(self.db_path, isolation_level=None)
+        locker.execute("BEGIN EXCLUSIVE")
+
+        async def compute():
+            return INTERVENTION
+
+        try:
+            with self.assertLogs("logic.intervention_cache", "WARNING"):
+                self.assertEqual(await cache.get_or_compute(b"k", compute), INTERVENTION)
+        finally:
+            locker.execute("ROLLBACK")
+            locker.close()
+
+    async def test_stale_entry_is_not_served_as_fresh(self):
+        cache = self.make_cache(ttl_seconds=0)
+        cache.set(b"k", {**INTERVENTION, "action_now": "old"})
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            return INTERVENTION
+
+        self.assertEqual(await cache.get_or_compute(b"k", compute), INTERVENTION)
+        self.assertEqual(len(calls), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,14 +8,16 @@ Provides common functionality for all You.com API clients:
 - Logging and monitoring
 """
 
+import asyncio
 import httpx
+import orjson
+import random
 import time
 import logging
+from importlib.util import find_spec
 from typing import Dict, Any, Optional
 from .config import config
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG if config.DEBUG else logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -24,27 +26,148 @@ class YouAPIError(Exception):
     pass
 
 
-class YouAPIClient:
-    """Base client for You.com API interactions."""
+# Shared HTTP client (connection pool reused across all API calls)
+_shared_client: Optional[httpx.AsyncClient] = None
 
-    def __init__(self):
-        self.config = config
-        self.session = httpx.AsyncClient(
-            timeout=config.API_TIMEOUT,
-            headers=self._get_default_headers()
+# Multiplex concurrent calls over one connection when httpx's HTTP/2 extra (h2) is installed
+_HTTP2_AVAILABLE = find_spec("h2") is not None
+
+
+class _TokenBucket:
+    """Async token bucket: allows `rate` requests per second on average."""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.capacity = max(rate, 1.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a request may be sent."""
+        # Holding the lock while sleeping serves waiters in arrival order
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class _CircuitBreaker:
+    """
+    Fails fast after repeated request failures so an upstream outage
+    doesn't cost every caller the full retry and timeout budget.
+    """
+
+    def __init__(self, fail_max: int, reset_seconds: float):
+        self.fail_max = fail_max
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+
+    def check(self):
+        """Raise YouAPIError while the circuit is open."""
+        if self.opened_at is None:
+            return
+
+        if time.monotonic() - self.opened_at < self.reset_seconds:
+            raise YouAPIError("Circuit open: skipping You.com API after repeated failures")
+
+        # Half-open: let requests through again; one more failure reopens the circuit
+        self.opened_at = None
+
+    def record_success(self):
+        """Reset the failure count and close the circuit."""
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self):
+        """Count a failed request; open the circuit after fail_max in a row."""
+        self.failures += 1
+        if self.failures >= self.fail_max:
+            if self.opened_at is None:
+                logger.warning("You.com API failing repeatedly - opening circuit for %ss", self.reset_seconds)
+            self.opened_at = time.monotonic()
+
+
+# Caps outstanding You.com requests so bursts don't trigger upstream throttling
+_request_slots = asyncio.Semaphore(config.MAX_CONCURRENT_REQUESTS)
+
+# Paces requests to stay under the You.com quota instead of hitting 429 backoff
+_request_rate: Optional[_TokenBucket] = (
+    _TokenBucket(config.MAX_REQUESTS_PER_SECOND) if config.MAX_REQUESTS_PER_SECOND > 0 else None
+)
+
+# Shared by all clients, since they all talk to the same upstream
+_circuit = _CircuitBreaker(config.CIRCUIT_FAIL_MAX, config.CIRCUIT_RESET_SECONDS)
+
+# Base delay before retrying after attempt N (exponential backoff, jittered per retry)
+_RETRY_SCHEDULE = tuple(
+    config.RETRY_DELAY * (config.RETRY_BACKOFF ** attempt)
+    for attempt in range(config.MAX_RETRIES)
+)
+
+
+def _get_default_headers() -> Dict[str, str]:
+    """Get default headers for API requests."""
+    headers = {
+        "Content-Type": "application/json",
+        "User-Agent": "FocusAura/0.1.0"
+    }
+
+    if config.has_api_key():
+        headers["Authorization"] = f"Bearer {config.API_KEY}"
+
+    return headers
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """
+    Get the process-wide HTTP client, creating it on first use.
+
+    Keeping one pooled client alive lets consecutive You.com calls reuse
+    open keep-alive connections instead of paying a TCP + TLS handshake
+    on every intervention.
+    """
+    global _shared_client
+
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            timeout=httpx.Timeout(config.API_TIMEOUT, connect=3.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=32,
+                max_connections=64,
+                keepalive_expiry=60
+            ),
+            headers=_get_default_headers()
         )
 
-    def _get_default_headers(self) -> Dict[str, str]:
-        """Get default headers for API requests."""
-        headers = {
-            "Content-Type": "application/json",
-            "User-Agent": "FocusAura/0.1.0"
-        }
+    return _shared_client
 
-        if config.has_api_key():
-            headers["Authorization"] = f"Bearer {config.API_KEY}"
 
-        return headers
+async def close_shared_client():
+    """Close the shared HTTP client (called on app shutdown)."""
+    global _shared_client
+
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
+
+
+class YouAPIClient:
+    """Base client for You.com API interactions."""
+
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        self.config = config
+        # Defaults to the process-wide pooled client; pass one in to use a custom transport
+        self.session = client if client is not None else get_shared_client()
 
     async def _make_request(
         self,
@@ -64,23 +187,29 @@ class YouAPIClient:
             Response JSON as dict
 
         Raises:
-            YouAPIError: If request fails after retries
+            YouAPIError: If request fails after retries, or the circuit is open
         """
+        _circuit.check()
         last_error = None
 
         for attempt in range(config.MAX_RETRIES):
             try:
                 if config.DEBUG:
-                    logger.debug(f"API Request [{attempt + 1}/{config.MAX_RETRIES}]: {method} {url}")
+                    logger.debug("API Request [%d/%d]: %s %s", attempt + 1, config.MAX_RETRIES, method, url)
+
+                if _request_rate is not None:
+                    await _request_rate.acquire()
 
-                response = await self.session.request(method, url, **kwargs)
+                async with _request_slots:
+                    response = await self.session.request(method, url, **kwargs)
 
                 if config.DEBUG:
-                    logger.debug(f"API Response: Status {response.status_code}")
+                    logger.debug("API Response: Status %d", response.status_code)
 
                 # Success
                 if response.status_code == 200:
-                    return response.json()
+                    _circuit.record_success()
+                    return orjson.loads(response.content)
 
                 # Handle specific error codes
                 if response.status_code == 401:
@@ -88,27 +217,27 @@ class YouAPIClient:
                 elif response.status_code == 403:
                     raise YouAPIError("Forbidden: API key may not have required permissions")
                 elif response.status_code == 429:
-                    logger.warning(f"Rate limited, retrying in {config.RETRY_DELAY}s")
-                    await self._sleep(config.RETRY_DELAY * (config.RETRY_BACKOFF ** attempt))
+                    last_error = YouAPIError("Rate limited")
+                    logger.warning("Rate limited (attempt %d/%d), retrying...", attempt + 1, config.MAX_RETRIES)
+                    await self._backoff(attempt)
                     continue
                 elif response.status_code >= 500:
-                    logger.warning(f"Server error {response.status_code}, retrying...")
-                    await self._sleep(config.RETRY_DELAY * (config.RETRY_BACKOFF ** attempt))
+                    last_error = YouAPIError(f"Server error {response.status_code}")
+                    logger.warning("Server error %d, retrying...", response.status_code)
+                    await self._backoff(attempt)
                     continue
                 else:
                     raise YouAPIError(f"API returned status {response.status_code}: {response.text}")
 
             except httpx.TimeoutException as e:
                 last_error = e
-                logger.warning(f"Request timeout (attempt {attempt + 1}/{config.MAX_RETRIES})")
-                if attempt < config.MAX_RETRIES - 1:
-                    await self._sleep(config.RETRY_DELAY * (config.RETRY_BACKOFF ** attempt))
+                logger.warning("Request timeout (attempt %d/%d)", attempt + 1, config.MAX_RETRIES)
+                await self._backoff(attempt)
 
             except httpx.RequestError as e:
                 last_error = e
-                logger.warning(f"Request error: {e} (attempt {attempt + 1}/{config.MAX_RETRIES})")
-                if attempt < config.MAX_RETRIES - 1:
-                    await self._sleep(config.RETRY_DELAY * (config.RETRY_BACKOFF ** attempt))
+                logger.warning("Request error: %s (attempt %d/%d)", e, attempt + 1, config.MAX_RETRIES)
+                await self._backoff(attempt)
 
             except YouAPIError:
                 # Don't retry on authentication/permission errors
@@ -116,16 +245,21 @@ class YouAPIClient:
 
             except Exception as e:
                 last_error = e
-                logger.error(f"Unexpected error: {e}")
-                if attempt < config.MAX_RETRIES - 1:
-                    await self._sleep(config.RETRY_DELAY)
+                logger.error("Unexpected error: %s", e)
+                await self._backoff(attempt)
 
         # All retries failed
+        _circuit.record_failure()
         raise YouAPIError(f"API request failed after {config.MAX_RETRIES} attempts: {last_error}")
 
+    async def _backoff(self, attempt: int):
+        """Wait before the next retry; no wait after the final attempt."""
+        if attempt < config.MAX_RETRIES - 1:
+            # Jitter spreads out clients that failed together so they don't retry in lockstep
+            await self._sleep(_RETRY_SCHEDULE[attempt] * random.uniform(0.5, 1.5))
+
     async def _sleep(self, seconds: float):
         """Async sleep for retry delays."""
-        import asyncio
         await asyncio.sleep(seconds)
 
     async def get(self, url: str, params: Optional[Dict] = None) -> Dict[str, Any]:
@@ -133,19 +267,9 @@ class YouAPIClient:
         return await self._make_request("GET", url, params=params)
 
     async def post(self, url: str, json: Optional[Dict] = None) -> Dict[str, Any]:
-        """Make POST request."""
-        return await self._make_request("POST", url, json=json)
-
-    async def close(self):
-        """Close the HTTP session."""
-        await self.session.aclose()
-
-    def __del__(self):
-        """Cleanup on deletion."""
-        try:
-            import asyncio
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                loop.create_task(self.session.aclose())
-        except:
-            pass
+        """Make POST request (JSON body encoded with orjson)."""
+        content = orjson.dumps(json) if json is not None else None
+        # Set per request: an injected client may not carry the default headers
+        return await self._make_request(
+            "POST", url, content=content, headers={"Content-Type": "application/json"}
+        )
@@ -6,6 +6,7 @@ Supports dual-mode operation: demo (templates) vs live (real APIs).
 """
 
 import os
+from functools import lru_cache
 from typing import Literal
 from dotenv import load_dotenv
 
@@ -29,9 +30,21 @@ class YouAPIConfig:
     # Timeouts
     API_TIMEOUT: float = float(os.getenv("YOU_API_TIMEOUT", "10"))
 
+    # Concurrency (max outstanding requests to You.com per process)
+    MAX_CONCURRENT_REQUESTS: int = int(os.getenv("YOU_API_MAX_CONCURRENCY", "16"))
+
+    # Rate limit (requests per second to You.com per process, 0 = unlimited)
+    MAX_REQUESTS_PER_SECOND: float = float(os.getenv("YOU_API_RATE_LIMIT", "0"))
+
     # Caching
     CACHE_ENABLED: bool = os.getenv("YOU_API_CACHE_ENABLED", "true").lower() == "true"
     CACHE_TTL: int = int(os.getenv("YOU_API_CACHE_TTL", "300"))
+    # Optional SQLite file so cached interventions survive restarts (empty = memory only)
+    CACHE_DB_PATH: str = os.getenv("YOU_API_CACHE_DB", "")
+
+    # Set to false to answer well-known distractions (video, social) from
+    # templates and only call the API for novel ones
+    LLM_FOR_COMMON_DISTRACTIONS: bool = os.getenv("YOU_API_LLM_FOR_COMMON_DISTRACTIONS", "true").lower() == "true"
 
     # Logging
     DEBUG: bool = os.getenv("YOU_API_DEBUG", "false").lower() == "true"
@@ -41,6 +54,10 @@ class YouAPIConfig:
     RETRY_DELAY: float = 1.0  # seconds
     RETRY_BACKOFF: float = 2.0  # exponential backoff multiplier
 
+    # Circuit breaker (skip API calls for a while after repeated failed requests)
+    CIRCUIT_FAIL_MAX: int = 5
+    CIRCUIT_RESET_SECONDS: float = 60.0
+
     @classmethod
     def is_demo_mode(cls) -> bool:
         """Check if running in demo mode (templates)."""
@@ -67,8 +84,14 @@ class YouAPIConfig:
             return "Live Mode (No API Key - Fallback to Templates)"
 
     @classmethod
+    @lru_cache(maxsize=None)
     def validate(cls) -> dict:
-        """Validate configuration and return status."""
+        """
+        Validate configuration and return status.
+
+        Settings are read from the environment once at import, so the
+        result is computed on the first call and reused afterwards.
+        """
         status = {
             "mode": cls.MODE,
             "mode_description": cls.get_mode_description(),
@@ -11,19 +11,51 @@ Endpoint: https://api.you.com/v1/agents/runs
 """
 
 import logging
-import uuid
-from typing import Dict, Optional, List
+import re
+from enum import IntEnum
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, List
 from .config import config
 from .base_client import YouAPIClient, YouAPIError
 
 logger = logging.getLogger(__name__)
 
 
+class _RunMode(IntEnum):
+    """How query_agents_api answers, fixed by the config at startup."""
+    DEMO = 0
+    LIVE = 1
+    NO_API_KEY = 2
+
+
+# Mode and API key come from the environment at import, so resolve them once
+if config.is_demo_mode():
+    _RUN_MODE = _RunMode.DEMO
+elif config.has_api_key():
+    _RUN_MODE = _RunMode.LIVE
+else:
+    _RUN_MODE = _RunMode.NO_API_KEY
+
+# Distraction keywords that select a template, matched in one pass over the query
+_CLASSIFIER = re.compile(r'youtube|video|social|twitter|facebook', re.IGNORECASE)
+_VIDEO_KEYWORDS = frozenset(("youtube", "video"))
+
+# Fixed part of every Agents API request body (tools is sent as an empty JSON array)
+_AGENTS_BODY_BASE = MappingProxyType({"stream": False, "tools": ()})
+
+
+def uses_live_api() -> bool:
+    """Check if query_agents_api calls the real API rather than returning templates."""
+    return _RUN_MODE == _RunMode.LIVE
+
+
 async def query_agents_api(
     input_text: str,
     agent: str = "express",
-    conversation_history: Optional[List[Dict[str, str]]] = None
-) -> Dict:
+    conversation_history: Optional[List[Dict[str, str]]] = None,
+    fallback_to_template: bool = True,
+    instructions: str = ""
+) -> Mapping:
     """
     Query You.com Agents API for AI-powered responses.
 
@@ -32,6 +64,11 @@ async def query_agents_api(
         agent: The agent to use (default: "express" for quick answers)
         conversation_history: Optional list of previous messages for context
                             Each message: {"role": "user"|"assistant", "content": "..."}
+        fallback_to_template: Return a template response if the live call fails
+                              or the API isn't live (demo mode, no API key);
+                              when False, raise YouAPIError instead
+        instructions: Optional fixed instructions placed before the history and
+                      input, so consecutive requests share a prompt prefix
 
     Returns:
         Dict with:
@@ -46,37 +83,40 @@ async def query_agents_api(
     """
 
     # Check mode
-    if config.is_demo_mode():
+    if _RUN_MODE == _RunMode.DEMO:
+        if not fallback_to_template:
+            raise YouAPIError("Agents API not called in demo mode")
         logger.info("Agents API: Using demo mode (templates)")
         return _get_template_response(input_text)
 
     # Live mode - try real API
-    if not config.has_api_key():
+    if _RUN_MODE == _RunMode.NO_API_KEY:
+        if not fallback_to_template:
+            raise YouAPIError("Agents API not called: no API key configured")
         logger.warning("Agents API: Live mode but no API key - falling back to templates")
         return _get_template_response(input_text)
 
     # Build request body with optional conversation history
-    request_body = {
-        "agent": agent,
-        "input": input_text,
-        "stream": False,
-        "tools": []
-    }
+    request_body = {"agent": agent, "input": input_text, **_AGENTS_BODY_BASE}
     
     # Add conversation history if provided (for context-aware responses)
     if conversation_history and len(conversation_history) > 0:
         # Build a contextual prompt that includes history
-        history_context = "\n\nPrevious interactions in this session:\n"
+        history_context = "Previous interactions in this session:\n"
         for i, msg in enumerate(conversation_history, 1):
             role = "User" if msg["role"] == "user" else "Assistant"
             history_context += f"{role}: {msg['content'][:200]}...\n"
         
         request_body["input"] = history_context + "\n\nCurrent situation:\n" + input_text
-        logger.info(f"Agents API: Including {len(conversation_history)} messages from conversation history")
+        logger.info("Agents API: Including %d messages from conversation history", len(conversation_history))
 
-    logger.info(f"Agents API: Querying with agent '{agent}': {input_text[:100]}...")
+    # Fixed instructions go first; only the tail of the input varies per request
+    if instructions:
+        request_body["input"] = instructions + "\n\n" + request_body["input"]
+
+    logger.info("Agents API: Querying with agent '%s': %.100s...", agent, input_text)
     if config.DEBUG:
-        logger.debug(f"Agents API Request: {request_body}")
+        logger.debug("Agents API Request: %s", request_body)
 
     try:
         client = YouAPIClient()
@@ -99,7 +139,7 @@ async def query_agents_api(
             # Fallback: use first item's text if no answer type found
             answer_text = output[0].get("text", "")
 
-        logger.info(f"Agents API: Success! Got response ({len(answer_text)} chars)")
+        logger.info("Agents API: Success! Got response (%d chars)", len(answer_text))
 
         return {
             "answer": answer_text,
@@ -107,103 +147,117 @@ async def query_agents_api(
         }
 
     except YouAPIError as e:
-        logger.error(f"Agents API error: {e} - falling back to templates")
+        if not fallback_to_template:
+            raise
+        logger.error("Agents API error: %s - falling back to templates", e)
         return _get_template_response(input_text)
 
     except Exception as e:
-        logger.error(f"Agents API unexpected error: {e} - falling back to templates")
+        if not fallback_to_template:
+            raise YouAPIError(f"Agents API unexpected error: {e}") from e
+        logger.error("Agents API unexpected error: %s - falling back to templates", e)
         return _get_template_response(input_text)
 
 
-def _get_template_response(query: str) -> Dict:
+# Template responses for demo mode or fallback. Built once and returned by
+# reference, so they are read-only
+_TEMPLATE_VIDEO = MappingProxyType({
+    "answer": (
+        "Evidence-based focus recovery techniques after video distractions:\n\n"
+        "1. **90-Second Physical Reset**: Stanford research shows brief walks "
+        "reset the prefrontal cortex and reduce the 'switching cost' from "
+        "entertainment to deep work.\n\n"
+        "2. **Time-Boxed Work Block**: Set a visible 25-minute timer to create "
+        "time pressure that activates focus (Pomodoro technique).\n\n"
+        "3. **Environmental Reset**: Close all non-work tabs and applications "
+        "to create a clean slate that reduces cognitive load."
+    ),
+    "search_results": (
+        {
+            "url": "https://www.stanford.edu/research/focus-recovery",
+            "name": "Stanford Research on Context Switching and Physical Activity",
+            "snippet": "Brief walks of 90 seconds have been shown to reset prefrontal cortex activity patterns after entertainment-based distractions..."
+        },
+        {
+            "url": "https://www.mit.edu/productivity-research",
+            "name": "MIT Study on Break Duration and Deep Work Recovery",
+            "snippet": "Research indicates 6-minute breaks are optimal for recovering focus after video content consumption..."
+        }
+    )
+})
+
+_TEMPLATE_SOCIAL = MappingProxyType({
+    "answer": (
+        "Evidence-based focus recovery techniques after social media distractions:\n\n"
+        "1. **Complete Digital Reset**: Close all tabs except your work application. "
+        "Harvard research shows social media triggers dopamine spikes that make "
+        "returning to cognitively demanding work 23 minutes harder on average.\n\n"
+        "2. **Implementation Intention**: Write one sentence about your next action. "
+        "This activates goal-directed behavior and reduces the pull of social stimuli.\n\n"
+        "3. **25-Minute Time Constraint**: Set a visible timer for focused work. "
+        "Time constraints reactivate executive function after social media exposure."
+    ),
+    "search_results": (
+        {
+            "url": "https://www.health.harvard.edu/social-media-impact",
+            "name": "Harvard Medical School: Social Media and Cognitive Load",
+            "snippet": "Social media context switches increase task resumption time by an average of 23 minutes due to dopamine-driven attention capture..."
+        },
+        {
+            "url": "https://www.nature.com/neuroscience/articles/focus",
+            "name": "Nature Neuroscience: Prefrontal Cortex Recovery Patterns",
+            "snippet": "Clean slate environments (minimal digital stimuli) show 34% faster focus recovery rates after social media exposure..."
+        }
+    )
+})
+
+_TEMPLATE_GENERIC = MappingProxyType({
+    "answer": (
+        "Evidence-based focus recovery techniques:\n\n"
+        "1. **Brief Physical Movement**: 90-second walks or stretches reset "
+        "prefrontal cortex activity and restore executive function.\n\n"
+        "2. **Box Breathing**: Three cycles of 4-4-4-4 breathing activates the "
+        "parasympathetic nervous system, reducing cortisol by up to 34%.\n\n"
+        "3. **Written Clarity**: Write one sentence about what you'll do next. "
+        "This activates implementation intentions and clarifies focus.\n\n"
+        "4. **Time-Boxed Sessions**: Set a 25-minute timer for focused work. "
+        "Time constraints activate motivation and reduce procrastination."
+    ),
+    "search_results": (
+        {
+            "url": "https://www.stanford.edu/neuroscience/focus",
+            "name": "Stanford Neuroscience: Brief Walks and Cognitive Reset",
+            "snippet": "90-second walks have been shown to reset prefrontal cortex activity patterns and restore attention after interruptions..."
+        },
+        {
+            "url": "https://www.health.harvard.edu/stress-management",
+            "name": "Harvard Medical: Box Breathing and Cortisol Reduction",
+            "snippet": "Box breathing reduces cortisol levels by 34% in knowledge workers and activates parasympathetic response..."
+        },
+        {
+            "url": "https://www.nature.com/articles/deep-work",
+            "name": "Cal Newport Research: Deep Work Recovery Techniques",
+            "snippet": "Time constraints combined with clear implementation intentions show highest success rates for focus recovery..."
+        }
+    )
+})
+
+
+def _get_template_response(query: str) -> Mapping:
     """
     Return template-based response for demo mode or fallback.
 
-    Simulates the structure of a real Smart API response.
+    Simulates the structure of a real Smart API response. The returned
+    mapping is shared and read-only.
     """
-    # Detect query type and return appropriate template
-    query_lower = query.lower()
-
-    if "youtube" in query_lower or "video" in query_lower:
-        answer = (
-            "Evidence-based focus recovery techniques after video distractions:\n\n"
-            "1. **90-Second Physical Reset**: Stanford research shows brief walks "
-            "reset the prefrontal cortex and reduce the 'switching cost' from "
-            "entertainment to deep work.\n\n"
-            "2. **Time-Boxed Work Block**: Set a visible 25-minute timer to create "
-            "time pressure that activates focus (Pomodoro technique).\n\n"
-            "3. **Environmental Reset**: Close all non-work tabs and applications "
-            "to create a clean slate that reduces cognitive load."
-        )
-        search_results = [
-            {
-                "url": "https://www.stanford.edu/research/focus-recovery",
-                "name": "Stanford Research on Context Switching and Physical Activity",
-                "snippet": "Brief walks of 90 seconds have been shown to reset prefrontal cortex activity patterns after entertainment-based distractions..."
-            },
-            {
-                "url": "https://www.mit.edu/productivity-research",
-                "name": "MIT Study on Break Duration and Deep Work Recovery",
-                "snippet": "Research indicates 6-minute breaks are optimal for recovering focus after video content consumption..."
-            }
-        ]
-
-    elif "social" in query_lower or "twitter" in query_lower or "facebook" in query_lower:
-        answer = (
-            "Evidence-based focus recovery techniques after social media distractions:\n\n"
-            "1. **Complete Digital Reset**: Close all tabs except your work application. "
-            "Harvard research shows social media triggers dopamine spikes that make "
-            "returning to cognitively demanding work 23 minutes harder on average.\n\n"
-            "2. **Implementation Intention**: Write one sentence about your next action. "
-            "This activates goal-directed behavior and reduces the pull of social stimuli.\n\n"
-            "3. **25-Minute Time Constraint**: Set a visible timer for focused work. "
-            "Time constraints reactivate executive function after social media exposure."
-        )
-        search_results = [
-            {
-                "url": "https://www.health.harvard.edu/social-media-impact",
-                "name": "Harvard Medical School: Social Media and Cognitive Load",
-                "snippet": "Social media context switches increase task resumption time by an average of 23 minutes due to dopamine-driven attention capture..."
-            },
-            {
-                "url": "https://www.nature.com/neuroscience/articles/focus",
-                "name": "Nature Neuroscience: Prefrontal Cortex Recovery Patterns",
-                "snippet": "Clean slate environments (minimal digital stimuli) show 34% faster focus recovery rates after social media exposure..."
-            }
-        ]
+    # Detect query type and return appropriate template; video keywords win
+    # over social ones wherever they appear in the query
+    keywords = {match.lower() for match in _CLASSIFIER.findall(query)}
 
+    if keywords & _VIDEO_KEYWORDS:
+        return _TEMPLATE_VIDEO
+    elif keywords:
+        return _TEMPLATE_SOCIAL
     else:
         # Generic focus recovery
-        answer = (
-            "Evidence-based focus recovery techniques:\n\n"
-            "1. **Brief Physical Movement**: 90-second walks or stretches reset "
-            "prefrontal cortex activity and restore executive function.\n\n"
-            "2. **Box Breathing**: Three cycles of 4-4-4-4 breathing activates the "
-            "parasympathetic nervous system, reducing cortisol by up to 34%.\n\n"
-            "3. **Written Clarity**: Write one sentence about what you'll do next. "
-            "This activates implementation intentions and clarifies focus.\n\n"
-            "4. **Time-Boxed Sessions**: Set a 25-minute timer for focused work. "
-            "Time constraints activate motivation and reduce procrastination."
-        )
-        search_results = [
-            {
-                "url": "https://www.stanford.edu/neuroscience/focus",
-                "name": "Stanford Neuroscience: Brief Walks and Cognitive Reset",
-                "snippet": "90-second walks have been shown to reset prefrontal cortex activity patterns and restore attention after interruptions..."
-            },
-            {
-                "url": "https://www.health.harvard.edu/stress-management",
-                "name": "Harvard Medical: Box Breathing and Cortisol Reduction",
-                "snippet": "Box breathing reduces cortisol levels by 34% in knowledge workers and activates parasympathetic response..."
-            },
-            {
-                "url": "https://www.nature.com/articles/deep-work",
-                "name": "Cal Newport Research: Deep Work Recovery Techniques",
-                "snippet": "Time constraints combined with clear implementation intentions show highest success rates for focus recovery..."
-            }
-        ]
-
-    return {
-        "answer": answer,
-        "search_results": search_results
-    }
+        return _TEMPLATE_GENERIC